@@ -2,11 +2,78 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+from scipy import sparse
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
 from pathlib import Path
-import json
+import orjson
+import csv
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Make the project package importable when run via `streamlit run dashboard/app.py`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.config import PROCESSED_DATA_DIR
+
+# Static page text, built once per process rather than on every rerun
+TITLE_MD = """
+Interactive dashboard for tracking Ethiopia's digital financial transformation.
+Forecasting access (account ownership) and usage (digital payments) for 2025-2027.
+"""
+
+ABOUT_METHODOLOGY_MD = """
+**Forecasting Approach:**
+- Baseline trend projection (linear regression)
+- Event-augmented modeling (impact matrix from Task 3)
+- Scenario analysis (Optimistic/Base/Pessimistic)
+
+**Data Sources:**
+- Global Findex Database (2011-2024)
+- National Bank of Ethiopia reports
+- EthSwitch transaction data
+- Telebirr and M-Pesa user statistics
+- Policy documents and regulatory announcements
+"""
+
+# Plain HTML, so these skip the markdown renderer. Text colour is inherited
+# and the background is translucent, so the boxes follow light and dark themes
+INFO_BOX_STYLE = (
+    "background-color: rgba(28, 131, 225, 0.1); color: inherit; "
+    "padding: 16px; border-radius: 8px;"
+)
+
+MOBILE_MONEY_HTML = f"""
+<div style="{INFO_BOX_STYLE}">
+<strong>📱 Mobile Money Driving Growth</strong>
+<ul>
+<li>Telebirr: 54M+ users (2021 launch)</li>
+<li>M-Pesa: 10M+ users (2023 entry)</li>
+<li>P2P transfers now exceed ATM withdrawals</li>
+</ul>
+</div>
+"""
+
+CHALLENGES_HTML = f"""
+<div style="{INFO_BOX_STYLE}">
+<strong>🎯 Key Challenges</strong>
+<ul>
+<li>Account ownership grew only +3pp (2021-2024)</li>
+<li>Gender gap persists (~10pp difference)</li>
+<li>Rural access remains limited</li>
+</ul>
+</div>
+"""
+
+FOOTER_HTML = (
+    '<div style="font-size: 0.875rem; opacity: 0.6;">'
+    'Developed by Selam Analytics | Data Sources: Global Findex, NBE, EthSwitch, '
+    'Telebirr, M-Pesa | Last Updated: February 2026'
+    '</div>'
+)
 
 # Set page config
 st.set_page_config(
@@ -18,10 +85,7 @@ st.set_page_config(
 
 # Title and description
 st.title("📈 Ethiopia Financial Inclusion Dashboard")
-st.markdown("""
-Interactive dashboard for tracking Ethiopia's digital financial transformation.
-Forecasting access (account ownership) and usage (digital payments) for 2025-2027.
-""")
+st.markdown(TITLE_MD)
 
 # Add sidebar
 with st.sidebar:
@@ -36,105 +100,299 @@ with st.sidebar:
     forecast_year = st.slider("Forecast Horizon (Years)", 1, 5, 3)
     confidence_level = st.slider("Confidence Level (%)", 80, 99, 95)
 
+# Columns each dashboard view reads from a Task 4 output (None = all columns)
+NEEDED_COLS = {
+    "final_forecast_table": ["Indicator", "Year", "Forecast_%"],
+    "scenario_comparison_2027": ["Indicator", "Range_pp"],
+    "enriched_main_data": ["record_type"],
+}
+
+# Arrow column types for the CSV tables; unlisted columns are inferred.
+# Indicator and record_type are dictionary-encoded (categoricals in pandas)
+# to shrink memory and speed up equality filters.
+DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+SCHEMAS = {
+    "baseline_forecasts_summary": {"Indicator": DICT_STRING, "Year": pa.int16()},
+    "event_augmented_forecasts": {"Indicator": DICT_STRING, "Year": pa.int16()},
+    "final_forecast_table": {
+        "Indicator": DICT_STRING, "Year": pa.int16(), "Forecast_%": pa.string()
+    },
+    "scenario_comparison_2027": {"Indicator": DICT_STRING, "Range_pp": pa.float64()},
+    "enriched_main_data": {"record_type": DICT_STRING, "indicator_code": DICT_STRING},
+}
+
+def arrow_dtype(arrow_type):
+    """Map Arrow types to pd.ArrowDtype, leaving dictionaries as categoricals"""
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+def apply_schema(table, name):
+    """Cast a Feather/Parquet copy to the column types the CSV reader gives.
+
+    Columns listed in SCHEMAS get those types; other text columns (written
+    by pandas as large_string) become string, as pyarrow's CSV reader infers.
+    """
+    schema = SCHEMAS.get(name, {})
+    for index, field in enumerate(table.schema):
+        arrow_type = schema.get(field.name, pa.string() if pa.types.is_large_string(field.type) else field.type)
+        if field.type != arrow_type:
+            table = table.set_column(index, field.name, table[field.name].cast(arrow_type))
+    return table
+
+def read_csv_header(csv_path):
+    """Read just the header row of a CSV"""
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+def read_csv_arrow(csv_path, columns=None, index_col=None):
+    """Parse a CSV with pyarrow's multi-threaded reader into pandas.
+
+    Only ``columns`` (those present in the header) are converted; the rest
+    are skipped by the parser rather than materialized and dropped.
+    """
+    include_columns = None
+    if columns is not None:
+        header = read_csv_header(csv_path)
+        include_columns = [c for c in columns if c in header]
+    convert_options = pv.ConvertOptions(
+        column_types=SCHEMAS.get(csv_path.stem, {}),
+        include_columns=include_columns,
+    )
+    table = pv.read_csv(csv_path, convert_options=convert_options)
+    df = table.to_pandas(types_mapper=arrow_dtype, split_blocks=True, self_destruct=True)
+    if index_col is not None:
+        df = df.set_index(df.columns[index_col])
+        # Unnamed index columns come through as '' rather than None
+        if df.index.name == '':
+            df.index.name = None
+    return df
+
+def resolve_table(csv_path, present):
+    """Return the fastest available copy of a Task 4 table.
+
+    Prefers an Arrow IPC (Feather) copy, then Parquet, then the CSV itself.
+    ``present`` is the set of file names in the processed directory, so
+    this needs no filesystem calls. Returns None if no copy exists.
+    """
+    for suffix in ('.feather', '.parquet', '.csv'):
+        path = csv_path.with_suffix(suffix)
+        if path.name in present:
+            return path
+    return None
+
+def read_table(path, filters=None, index_col=None):
+    """Read a Task 4 table from its Feather, Parquet or CSV copy.
+
+    Column projection comes from NEEDED_COLS and equality ``filters`` are
+    pushed down into the Parquet reader. Columns or filters that the file
+    does not have are ignored, so older outputs still load.
+    """
+    columns = NEEDED_COLS.get(path.stem)
+    
+    if path.suffix == '.feather':
+        # Memory-mapped: column buffers are paged in from the OS page cache,
+        # shared across Streamlit workers, instead of being read and decoded
+        with pa.memory_map(str(path), 'r') as source:
+            table = ipc.RecordBatchFileReader(source).read_all()
+        if columns is not None:
+            table = table.select([c for c in columns if c in table.column_names])
+        for column, _, value in filters or []:
+            if column in table.column_names:
+                table = table.filter(pc.equal(table[column], value))
+        # Same column types as the CSV reader, whichever copy is present
+        return apply_schema(table, path.stem).to_pandas(types_mapper=arrow_dtype)
+    
+    if path.suffix == '.parquet':
+        available = pq.read_schema(path).names
+        if columns is not None:
+            columns = [c for c in columns if c in available]
+        filters = [f for f in filters or [] if f[0] in available] or None
+        table = pq.read_table(path, columns=columns, filters=filters)
+        return apply_schema(table, path.stem).to_pandas(types_mapper=arrow_dtype)
+    
+    # CSV fallback for outputs generated before the Parquet writer existed
+    df = read_csv_arrow(path, columns=columns, index_col=index_col)
+    for column, _, value in filters or []:
+        if column in df.columns:
+            df = df[df[column] == value].reset_index(drop=True)
+            # Keep only the categories that survive, as in the filtered Parquet copy
+            for name in df.select_dtypes('category').columns:
+                df[name] = df[name].cat.remove_unused_categories()
+    return df
+
+def read_historical(path):
+    """Read observation records, or None if the file has no record_type"""
+    # Filter for observations only (pushed down into the Parquet reader)
+    historical_df = read_table(path, filters=[('record_type', '=', 'observation')])
+    if 'record_type' in historical_df.columns:
+        return historical_df
+    return None
+
+def read_events(path):
+    """Read the event-indicator impact matrix"""
+    return read_table(path, index_col=0)
+
+def read_text(path, limit=-1):
+    """Read a text output such as the executive summary, up to ``limit`` chars"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read(limit)
+
+def read_json(path):
+    """Read a JSON output such as the final report"""
+    return orjson.loads(path.read_bytes())
+
+def build_forecast_lookup(forecasts):
+    """Map (indicator, year) to the numeric forecast, stripping '%' once"""
+    if not {'Indicator', 'Year', 'Forecast_%'}.issubset(forecasts.columns):
+        return {}
+    values = pd.to_numeric(
+        forecasts['Forecast_%'].astype(str).str.rstrip('%'), errors='coerce'
+    )
+    return {
+        (indicator, int(year)): float(value)
+        for indicator, year, value in zip(forecasts['Indicator'], forecasts['Year'], values)
+        if pd.notna(value)
+    }
+
+def processed_mtime_key():
+    """Snapshot (name, mtime) of every file in data/processed.
+
+    Passed to load_data() so its cache entry is invalidated only when Task 4
+    outputs are added, removed or rewritten. Empty if the directory is missing.
+    """
+    try:
+        with os.scandir(PROCESSED_DATA_DIR) as entries:
+            return tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in entries))
+    except FileNotFoundError:
+        return ()
+
 # Load data function
 @st.cache_data
-def load_data():
-    """Load all forecasting data from Task 4 outputs"""
-    
-    # Define paths to Task 4 outputs
-    # Try different possible project structures
-    possible_paths = [
-        Path.cwd().parent,  # dashboard/ in project root
-        Path.cwd(),         # Running from project root
-        Path.cwd().parent.parent  # Nested structure
-    ]
+def load_data(mtime_key):
+    """Load the tabular forecasting data from Task 4 outputs"""
     
     data = {}
-    data_processed_path = None
-    
-    # Find the data directory
-    for base_path in possible_paths:
-        test_path = base_path / "data" / "processed"
-        if test_path.exists():
-            data_processed_path = test_path
-            break
+    data_processed_path = PROCESSED_DATA_DIR
     
-    if data_processed_path is None:
-        st.sidebar.error("❌ Could not find data/processed directory")
-        return data, False
+    # (key, path, loader, sidebar message) for each Task 4 output
+    sources = [
+        ('baseline', data_processed_path / "baseline_forecasts_summary.csv",
+         read_table, "Loaded baseline forecasts"),
+        ('augmented', data_processed_path / "event_augmented_forecasts.csv",
+         read_table, "Loaded event-augmented forecasts"),
+        ('scenarios', data_processed_path / "scenario_forecasts_comparison.csv",
+         read_table, "Loaded scenario forecasts"),
+        ('forecasts', data_processed_path / "final_forecast_table.csv",
+         read_table, "Loaded final forecasts"),
+        ('comparison_2027', data_processed_path / "scenario_comparison_2027.csv",
+         read_table, "Loaded 2027 comparison"),
+        ('historical', data_processed_path / "enriched_main_data.csv",
+         read_historical, "Loaded historical data"),
+        ('events', data_processed_path / "event_indicator_matrix_refined.csv",
+         read_events, "Loaded events matrix"),
+    ]
     
     try:
-        # 1. Load baseline forecasts
-        baseline_path = data_processed_path / "baseline_forecasts_summary.csv"
-        if baseline_path.exists():
-            data['baseline'] = pd.read_csv(baseline_path)
-            st.sidebar.success(f"✅ Loaded baseline forecasts")
+        if not data_processed_path.is_dir():
+            raise FileNotFoundError(f"Processed data directory not found: {data_processed_path}")
         
-        # 2. Load event-augmented forecasts
-        augmented_path = data_processed_path / "event_augmented_forecasts.csv"
-        if augmented_path.exists():
-            data['augmented'] = pd.read_csv(augmented_path)
-            st.sidebar.success(f"✅ Loaded event-augmented forecasts")
+        # Reuse the cache key's directory listing instead of stat()-ing each file
+        present = {name for name, _ in mtime_key}
         
-        # 3. Load scenario comparison
-        scenario_path = data_processed_path / "scenario_forecasts_comparison.csv"
-        if scenario_path.exists():
-            data['scenarios'] = pd.read_csv(scenario_path)
-            st.sidebar.success(f"✅ Loaded scenario forecasts")
+        loaded = set()
         
-        # 4. Load final forecast table
-        final_forecast_path = data_processed_path / "final_forecast_table.csv"
-        if final_forecast_path.exists():
-            data['forecasts'] = pd.read_csv(final_forecast_path)
-            st.sidebar.success(f"✅ Loaded final forecasts")
+        # Read files concurrently; Streamlit isn't thread-safe, so workers
+        # only return data and all st.* calls stay on this thread
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {}
+            for key, csv_path, loader, _ in sources:
+                path = resolve_table(csv_path, present)
+                if path is not None:
+                    futures[executor.submit(loader, path)] = key
+            for future in as_completed(futures):
+                result = future.result()
+                if result is not None:
+                    data[futures[future]] = result
+                    loaded.add(futures[future])
         
-        # 5. Load scenario comparison for 2027
-        comparison_path = data_processed_path / "scenario_comparison_2027.csv"
-        if comparison_path.exists():
-            data['comparison_2027'] = pd.read_csv(comparison_path)
-            st.sidebar.success(f"✅ Loaded 2027 comparison")
-        
-        # 6. Load historical data (if available)
-        historical_path = data_processed_path / "enriched_main_data.csv"
-        if historical_path.exists():
-            historical_df = pd.read_csv(historical_path)
-            # Filter for observations only
-            if 'record_type' in historical_df.columns:
-                data['historical'] = historical_df[historical_df['record_type'] == 'observation'].copy()
-                st.sidebar.success(f"✅ Loaded historical data")
-        
-        # 7. Load events data
-        events_path = data_processed_path / "event_indicator_matrix_refined.csv"
-        if events_path.exists():
-            data['events'] = pd.read_csv(events_path, index_col=0)
-            st.sidebar.success(f"✅ Loaded events matrix")
-        
-        # 8. Load executive summary
-        summary_path = data_processed_path / "forecasting_executive_summary.txt"
-        if summary_path.exists():
-            with open(summary_path, 'r', encoding='utf-8') as f:
-                data['executive_summary'] = f.read()
-            st.sidebar.success(f"✅ Loaded executive summary")
+        # Precompute lookups used on every rerun
+        data['datasets_loaded_count'] = len(loaded)
+        if 'forecasts' in data:
+            data['forecast_lookup'] = build_forecast_lookup(data['forecasts'])
+        if 'comparison_2027' in data and 'Range_pp' in data['comparison_2027'].columns:
+            comparison = data['comparison_2027']
+            data['range_2027'] = dict(zip(comparison['Indicator'], comparison['Range_pp']))
+        if 'events' in data:
+            # Mostly-empty matrix: keep only the filled cells (zeros included)
+            events = data.pop('events')
+            values = events.to_numpy(dtype=float, na_value=np.nan)
+            rows, cols = np.nonzero(~np.isnan(values))
+            data['events_sparse'] = sparse.csr_matrix(
+                (values[rows, cols], (rows, cols)), shape=values.shape
+            )
+            data['events_nnz'] = data['events_sparse'].nnz
+            data['event_names'] = events.index.to_numpy(dtype=str)
+            data['event_indicators'] = events.columns.to_numpy(dtype=str)
+        if 'historical' in data:
+            data['historical_n'] = len(data['historical'])
         
-        # 9. Load final report
-        report_path = data_processed_path / "final_forecasting_report.json"
-        if report_path.exists():
-            with open(report_path, 'r') as f:
-                data['report'] = json.load(f)
-            st.sidebar.success(f"✅ Loaded final report")
+        for key, _, _, message in sources:
+            if key in loaded:
+                st.sidebar.success(f"✅ {message}")
         
-        data_loaded = len(data) > 0
+        data_loaded = bool(loaded)
         return data, data_loaded
             
     except Exception as e:
         st.sidebar.error(f"❌ Error loading data: {str(e)}")
         return data, False
 
+SUMMARY_PATH = PROCESSED_DATA_DIR / "forecasting_executive_summary.txt"
+REPORT_PATH = PROCESSED_DATA_DIR / "final_forecasting_report.json"
+
+# Longest executive summary preview shown before "Show full text" (64 KiB)
+SUMMARY_PREVIEW_CHARS = 65536
+
+# Read-only text/JSON outputs are cached as resources so reruns get them back
+# by reference instead of unpickling them from the st.cache_data store.
+# The file's mtime is part of the key, so a Task 4 rerun refreshes them.
+@st.cache_resource(max_entries=1)
+def load_executive_summary(summary_path, mtime_ns):
+    """Load the Task 4 executive summary text, or None if missing.
+
+    Reads at most one character past SUMMARY_PREVIEW_CHARS, which is enough
+    for the Overview to tell whether the preview was truncated.
+    """
+    if mtime_ns is None or not summary_path.exists():
+        return None
+    return read_text(summary_path, limit=SUMMARY_PREVIEW_CHARS + 1)
+
+@st.cache_resource(max_entries=1)
+def load_final_report(report_path, mtime_ns):
+    """Load the Task 4 final report JSON, or None if missing"""
+    if mtime_ns is None or not report_path.exists():
+        return None
+    return read_json(report_path)
+
 # Load data
-data, data_loaded = load_data()
+mtime_key = processed_mtime_key()
+data, data_loaded = load_data(mtime_key)
+mtimes = dict(mtime_key)
 
-# Main content based on selected page
-if page == "📊 Overview":
+executive_summary = load_executive_summary(SUMMARY_PATH, mtimes.get(SUMMARY_PATH.name))
+if executive_summary is not None:
+    st.sidebar.success("✅ Loaded executive summary")
+
+final_report = load_final_report(REPORT_PATH, mtimes.get(REPORT_PATH.name))
+if final_report is not None:
+    st.sidebar.success("✅ Loaded final report")
+
+# Page renderers. Each page is a fragment, so widgets inside it rerun
+# only that page instead of the whole script.
+@st.fragment
+def overview_fragment(data, data_loaded, executive_summary):
+    """Render the Overview page"""
     st.header("Overview Dashboard")
     
     if data_loaded:
@@ -143,16 +401,7 @@ if page == "📊 Overview":
         
         # Helper function to extract forecast values safely
         def get_forecast_value(indicator, year):
-            if 'forecasts' in data:
-                try:
-                    value = data['forecasts'][
-                        (data['forecasts']['Indicator'] == indicator) & 
-                        (data['forecasts']['Year'] == year)
-                    ]['Forecast_%'].values[0]
-                    return float(value.replace('%', ''))
-                except:
-                    return None
-            return None
+            return data.get('forecast_lookup', {}).get((indicator, year))
         
         with col1:
             # Current account ownership (from document)
@@ -199,29 +448,13 @@ if page == "📊 Overview":
         
         with col4:
             # Scenario range
-            if 'comparison_2027' in data:
-                try:
-                    row = data['comparison_2027'][
-                        data['comparison_2027']['Indicator'] == 'ACC_OWNERSHIP'
-                    ].iloc[0]
-                    if 'Range_pp' in row and pd.notna(row['Range_pp']):
-                        st.metric(
-                            label="Scenario Range (2027)",
-                            value=f"{row['Range_pp']}pp",
-                            delta="Optimistic vs Pessimistic"
-                        )
-                    else:
-                        st.metric(
-                            label="Scenario Range (2027)",
-                            value="--",
-                            delta="Data required"
-                        )
-                except:
-                    st.metric(
-                        label="Scenario Range (2027)",
-                        value="--",
-                        delta="Data required"
-                    )
+            range_pp = data.get('range_2027', {}).get('ACC_OWNERSHIP')
+            if range_pp is not None and pd.notna(range_pp):
+                st.metric(
+                    label="Scenario Range (2027)",
+                    value=f"{range_pp}pp",
+                    delta="Optimistic vs Pessimistic"
+                )
             else:
                 st.metric(
                     label="Scenario Range (2027)",
@@ -231,10 +464,14 @@ if page == "📊 Overview":
         
         # Executive summary section
         st.subheader("Executive Summary")
-        if 'executive_summary' in data:
-            # Display first 500 characters with expander
+        if executive_summary is not None:
+            # Display a capped preview; the full file is read only on request
             with st.expander("View Executive Summary"):
-                st.write(data['executive_summary'])
+                truncated = len(executive_summary) > SUMMARY_PREVIEW_CHARS
+                if truncated and st.button("Show full text"):
+                    st.write(read_text(SUMMARY_PATH))
+                else:
+                    st.write(executive_summary[:SUMMARY_PREVIEW_CHARS])
         else:
             st.info("Run Task 4 to generate executive summary")
         
@@ -243,42 +480,23 @@ if page == "📊 Overview":
         insight_col1, insight_col2 = st.columns(2)
         
         with insight_col1:
-            st.info("""
-            **📱 Mobile Money Driving Growth**
-            - Telebirr: 54M+ users (2021 launch)
-            - M-Pesa: 10M+ users (2023 entry)
-            - P2P transfers now exceed ATM withdrawals
-            """)
+            st.html(MOBILE_MONEY_HTML)
         
         with insight_col2:
-            st.info("""
-            **🎯 Key Challenges**
-            - Account ownership grew only +3pp (2021-2024)
-            - Gender gap persists (~10pp difference)
-            - Rural access remains limited
-            """)
+            st.html(CHALLENGES_HTML)
         
         # Data availability
         st.subheader("Data Availability")
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            datasets_loaded = len([k for k in data.keys() if k not in ['executive_summary', 'report']])
-            st.metric("Datasets Loaded", datasets_loaded)
+            st.metric("Datasets Loaded", data.get('datasets_loaded_count', 0))
         
         with col2:
-            if 'historical' in data:
-                historical_points = len(data['historical'])
-                st.metric("Historical Data Points", historical_points)
-            else:
-                st.metric("Historical Data Points", 0)
+            st.metric("Historical Data Points", data.get('historical_n', 0))
         
         with col3:
-            if 'events' in data:
-                event_relationships = data['events'].notna().sum().sum()
-                st.metric("Event Relationships", event_relationships)
-            else:
-                st.metric("Event Relationships", 0)
+            st.metric("Event Relationships", data.get('events_nnz', 0))
     
     else:
         st.warning("⚠️ Data not loaded. Please run Task 4 forecasting first.")
@@ -289,22 +507,35 @@ if page == "📊 Overview":
         3. Restart this dashboard
         """)
 
-elif page == "📈 Trends":
+@st.fragment
+def trends_fragment(data):
+    """Render the Trends page"""
+    # Plotly is imported per chart page so Overview/About don't pay its import cost
+    import plotly.express as px
+    
     st.header("Historical Trends Analysis")
     st.info("This page will show interactive historical trend charts")
     st.write("Coming soon...")
 
-elif page == "🔮 Forecasts":
+@st.fragment
+def forecasts_fragment(data):
+    """Render the Forecasts page"""
+    import plotly.graph_objects as go
+    
     st.header("Forecasts 2025-2027")
     st.info("This page will show forecast visualizations")
     st.write("Coming soon...")
 
-elif page == "🎯 Projections":
+@st.fragment
+def projections_fragment(data):
+    """Render the Projections page"""
     st.header("Inclusion Projections")
     st.info("This page will show progress toward 2030 targets")
     st.write("Coming soon...")
 
-elif page == "📋 About":
+@st.fragment
+def about_fragment():
+    """Render the About page"""
     st.header("About this Dashboard")
     
     st.subheader("Project Overview")
@@ -324,19 +555,7 @@ elif page == "📋 About":
     """)
     
     st.subheader("Methodology")
-    st.write("""
-    **Forecasting Approach:**
-    - Baseline trend projection (linear regression)
-    - Event-augmented modeling (impact matrix from Task 3)
-    - Scenario analysis (Optimistic/Base/Pessimistic)
-    
-    **Data Sources:**
-    - Global Findex Database (2011-2024)
-    - National Bank of Ethiopia reports
-    - EthSwitch transaction data
-    - Telebirr and M-Pesa user statistics
-    - Policy documents and regulatory announcements
-    """)
+    st.write(ABOUT_METHODOLOGY_MD)
     
     st.subheader("Technical Details")
     st.code("""
@@ -353,9 +572,18 @@ elif page == "📋 About":
     - **National Bank of Ethiopia** - Regulatory guidance
     """)
 
+# Main content based on selected page
+if page == "📊 Overview":
+    overview_fragment(data, data_loaded, executive_summary)
+elif page == "📈 Trends":
+    trends_fragment(data)
+elif page == "🔮 Forecasts":
+    forecasts_fragment(data)
+elif page == "🎯 Projections":
+    projections_fragment(data)
+elif page == "📋 About":
+    about_fragment()
+
 # Footer
 st.divider()
-st.caption("""
-Developed by Selam Analytics | Data Sources: Global Findex, NBE, EthSwitch, Telebirr, M-Pesa | 
-Last Updated: February 2026
-""")
\ No newline at end of file
+st.html(FOOTER_HTML)
\ No newline at end of file
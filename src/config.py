@@ -4,6 +4,8 @@ Configuration settings for Ethiopia Financial Inclusion Forecasting System.
 
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -18,10 +20,16 @@ REPORTS_DIR = PROJECT_ROOT / "reports"
 FIGURES_DIR = REPORTS_DIR / "figures"
 MODELS_DIR = PROJECT_ROOT / "models"
 
-# Create directories if they don't exist
-for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, 
-                  REPORTS_DIR, FIGURES_DIR, MODELS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+def ensure_dirs():
+    """
+    Create the project directories if they don't exist.
+    
+    Called from pipeline entry points rather than at import time, so that
+    importing this module (e.g. from the dashboard) touches no files.
+    """
+    for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, 
+                      REPORTS_DIR, FIGURES_DIR, MODELS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
 
 # Data URLs (from challenge document)
 DATA_URLS = {
@@ -30,26 +38,26 @@ DATA_URLS = {
     "additional_data": "https://docs.google.com/spreadsheets/d/1mosiu40PUV-pq-yVFZdVFWt9fQ0A0jlw/export?format=csv"
 }
 
-# Key indicators from Global Findex
-INDICATORS = {
-    "ACCESS": {
+# Key indicators from Global Findex (read-only views, safe to share without copying)
+INDICATORS: Final = MappingProxyType({
+    "ACCESS": MappingProxyType({
         "code": "ACC_OWNERSHIP",
         "name": "Account Ownership Rate",
         "definition": "The share of adults (age 15+) who report having an account at a financial institution or using mobile money"
-    },
-    "USAGE": {
+    }),
+    "USAGE": MappingProxyType({
         "code": "USG_DIGITAL_PAYMENT",
         "name": "Digital Payment Adoption Rate",
         "definition": "The share of adults who report using digital payments in the past 12 months"
-    }
-}
+    })
+})
 
 # Ethiopia-specific constants
-ETHIOPIA_POPULATION_2024 = 126_000_000  # Approximate
-ADULT_POPULATION_RATIO = 0.6  # 60% of population is 15+ (estimate)
+ETHIOPIA_POPULATION_2024: Final = 126_000_000  # Approximate
+ADULT_POPULATION_RATIO: Final = 0.6  # 60% of population is 15+ (estimate)
 
 # Event categories
-EVENT_CATEGORIES = [
+EVENT_CATEGORIES: Final = (
     "policy",
     "product_launch",
     "infrastructure",
@@ -57,16 +65,16 @@ EVENT_CATEGORIES = [
     "milestone",
     "partnership",
     "regulation"
-]
+)
 
 # Pillars
-PILLARS = ["access", "usage", "quality", "welfare"]
+PILLARS: Final = ("access", "usage", "quality", "welfare")
 
 # Model settings
 RANDOM_SEED = int(os.getenv("RANDOM_SEED", 42))
-FORECAST_YEARS = [2025, 2026, 2027]
-HISTORICAL_START_YEAR = 2011
-HISTORICAL_END_YEAR = 2024
+FORECAST_YEARS: Final = (2025, 2026, 2027)
+HISTORICAL_START_YEAR: Final = 2011
+HISTORICAL_END_YEAR: Final = 2024
 
 # Dashboard settings
 DASHBOARD_TITLE = "Ethiopia Financial Inclusion Forecasting System"
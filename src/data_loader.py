@@ -5,19 +5,273 @@ Updated to handle Excel files.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import io
 from pathlib import Path
-import requests
-from typing import Tuple, Dict, Optional, List
+import openpyxl
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Tuple, Dict, Optional, List, Union
 import logging
+from datetime import datetime
+
+# Optional: Polars parses CSV files much faster than pandas
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Column types applied while reading the unified dataset
+UNIFIED_DTYPES = {"record_type": "string", "indicator_code": "string"}
+# Date columns of the unified dataset. Needed for readers that don't see
+# Excel's cell formats (pyxlsb, CSV)
+UNIFIED_DATE_COLUMNS = ("date", "observation_date", "period_start", "period_end", "collection_date")
+
+# Sheet names tried, in order, when looking for the unified dataset
+UNIFIED_SHEET_NAMES = ('data', 'Sheet1', 'unified_data', 'ethiopia_fi', 'main', 'observations')
+
+# Excel engines by file extension (.xlsb needs the optional pyxlsb package)
+EXCEL_ENGINES = {'.xlsx': 'openpyxl', '.xlsb': 'pyxlsb'}
+
+# Read into Arrow-backed columns where pandas supports it (pandas >= 2.0)
+DTYPE_BACKEND_KWARGS = {"dtype_backend": "pyarrow"} if int(pd.__version__.split(".")[0]) >= 2 else {}
+
+# Parse date strings element by element without a format warning (pandas >= 2.0)
+DATE_FORMAT_KWARGS = {"format": "mixed"} if DTYPE_BACKEND_KWARGS else {}
+
+# Resolution pandas gives datetime cells read from Excel ('ns' before pandas 3.0, 'us' since)
+DEFAULT_DATETIME_UNIT = np.datetime_data(pd.Series([datetime(2000, 1, 1)]).dtype)[0]
+
+def _read_csv_polars(source: Union[Path, io.BytesIO], name: str) -> Optional[pd.DataFrame]:
+    """
+    Read a CSV file with Polars and hand it to pandas.
+    
+    The result matches a plain pd.read_csv: no dates are inferred (callers
+    parse their own date columns) and all-empty or gappy integer columns are
+    float, so column types don't depend on whether Polars is installed.
+    Columns are handed over as Arrow arrays where pandas supports them.
+    
+    Parameters:
+    -----------
+    source : Union[Path, io.BytesIO]
+        CSV file, or its contents already read into memory
+    name : str
+        File name, for log messages
+        
+    Returns:
+    --------
+    Optional[pd.DataFrame]
+        Loaded dataframe, or None if Polars is unavailable or the read fails
+        (callers then fall back to pd.read_csv)
+    """
+    if pl is None:
+        return None
+    
+    try:
+        pl_df = pl.read_csv(source)
+        # Polars reads all-empty columns as String; pandas gives float NaN
+        empty_columns = [column for column in pl_df.columns if pl_df[column].null_count() == pl_df.height]
+        # ...and integer columns with gaps as float
+        gappy_int_columns = [column for column in pl_df.columns
+                             if pl_df[column].dtype.is_integer() and pl_df[column].null_count() > 0]
+        pl_df = pl_df.with_columns(pl.col(empty_columns + gappy_int_columns).cast(pl.Float64))
+        return pl_df.to_pandas(use_pyarrow_extension_array=bool(DTYPE_BACKEND_KWARGS))
+    except Exception as e:
+        logger.warning("⚠️  Polars could not read %s, using pandas: %s", name, e)
+        return None
+
+def _strip_trailing_blanks(row: tuple) -> tuple:
+    """Drop trailing empty cells from a worksheet row."""
+    end = len(row)
+    while end and row[end - 1] is None:
+        end -= 1
+    return row[:end]
+
+def _stringify_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store object columns that mix text with numbers as text.
+    
+    Arrow and Parquet need one type per column, so columns like fiscal_year
+    (2021 next to 'FY2022/23') are written as strings. Whole-number
+    floats are rendered without the trailing '.0'.
+    """
+    for column in df.columns[df.dtypes == object]:
+        values = df[column].dropna()
+        is_text = values.map(lambda value: isinstance(value, str))
+        if is_text.any() and not is_text.all():
+            df[column] = df[column].map(
+                lambda value: value if value is None or isinstance(value, str) or pd.isna(value)
+                else str(int(value)) if isinstance(value, float) and value.is_integer()
+                else str(value)
+            )
+    return df
+
+def arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of df that can be written to Parquet/Feather.
+    
+    Object columns mixing text with other values (e.g. fiscal_year holding
+    2021 and 'FY2022/23') are stored as text; other columns are unchanged.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dataframe to write
+        
+    Returns:
+    --------
+    pd.DataFrame
+        Copy with mixed-type columns stringified
+    """
+    return _stringify_mixed_columns(df.copy())
+
+def _read_sheet_fast(workbook, sheet_name: str, nrows: Optional[int] = None,
+                     dtype: Optional[Dict[str, str]] = None,
+                     parse_dates: Tuple[str, ...] = ()) -> pd.DataFrame:
+    """
+    Stream a worksheet from a read-only openpyxl workbook into a DataFrame.
+    
+    Rows are pulled straight from openpyxl's iterator, skipping the per-cell
+    conversion layer of pd.read_excel. The first row is used as the header.
+    
+    Parameters:
+    -----------
+    workbook : openpyxl.Workbook
+        Workbook opened with read_only=True
+    sheet_name : str
+        Name of the sheet to read
+    nrows : Optional[int]
+        Number of data rows to read (all rows if None)
+    dtype : Optional[Dict[str, str]]
+        Column types to apply, for columns present in the sheet
+    parse_dates : Tuple[str, ...]
+        Columns to parse as datetimes, for columns present in the sheet
+        
+    Returns:
+    --------
+    pd.DataFrame
+        Sheet contents
+    """
+    rows = workbook[sheet_name].iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    
+    data = list(rows) if nrows is None else list(islice(rows, nrows))
+    
+    # Read-only mode can report empty rows past the end of the data
+    while data and all(value is None for value in data[-1]):
+        data.pop()
+    
+    # Like pd.read_excel, trim trailing blank cells, pad ragged rows to a
+    # common width and name blank header cells "Unnamed: i"
+    header = _strip_trailing_blanks(header)
+    data = [_strip_trailing_blanks(row) for row in data]
+    width = max([len(header)] + [len(row) for row in data])
+    header = tuple(header) + (None,) * (width - len(header))
+    columns = [f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)]
+    data = [tuple(row) + (None,) * (width - len(row)) for row in data]
+    
+    df = pd.DataFrame(data, columns=columns)
+    
+    # Fully blank columns come back as object; pd.read_excel gives float NaN
+    blank_columns = df.columns[df.isna().all()]
+    if len(blank_columns) > 0:
+        df[blank_columns] = df[blank_columns].astype(float)
+    
+    # pd.read_excel also turns whole-number float cells into ints
+    for column in df.select_dtypes(include='float').columns:
+        values = df[column]
+        if len(values) > 0 and values.notna().all() and (values % 1 == 0).all():
+            df[column] = values.astype('int64')
+    
+    return _finalize_frame(df, dtype, parse_dates)
+
+def _is_arrow_string(dtype) -> bool:
+    """Whether dtype is an Arrow-backed string type (e.g. from Polars)."""
+    return isinstance(dtype, pd.ArrowDtype) and (pa.types.is_string(dtype.pyarrow_dtype)
+                                                 or pa.types.is_large_string(dtype.pyarrow_dtype))
+
+def _datetime_unit(df: pd.DataFrame) -> str:
+    """Resolution of the first datetime column in df, or DEFAULT_DATETIME_UNIT if it has none."""
+    for dtype in df.dtypes:
+        if not pd.api.types.is_datetime64_any_dtype(dtype):
+            continue
+        if isinstance(dtype, pd.ArrowDtype):
+            return dtype.pyarrow_dtype.unit
+        return getattr(dtype, "unit", None) or np.datetime_data(dtype)[0]
+    return DEFAULT_DATETIME_UNIT
+
+def _finalize_frame(df: pd.DataFrame, dtype: Optional[Dict[str, str]] = None,
+                    parse_dates: Tuple[str, ...] = ()) -> pd.DataFrame:
+    """
+    Apply column types to a sheet read from Excel and convert it to the loader's dtype backend.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Sheet as read from the workbook
+    dtype : Optional[Dict[str, str]]
+        Column types to apply, for columns present in the sheet
+    parse_dates : Tuple[str, ...]
+        Columns to parse as datetimes, for columns present in the sheet
+        
+    Returns:
+    --------
+    pd.DataFrame
+        Typed dataframe
+    """
+    if dtype:
+        # Arrow string columns (from Polars) already have the text type
+        df = df.astype({column: kind for column, kind in dtype.items()
+                        if column in df.columns and not (kind == "string" and _is_arrow_string(df[column].dtype))})
+    date_unit = _datetime_unit(df)
+    for column in parse_dates:
+        if (column not in df.columns or df[column].isna().all()
+                or pd.api.types.is_datetime64_any_dtype(df[column])):
+            continue
+        if pd.api.types.is_numeric_dtype(df[column]):
+            # Excel date serials (pyxlsb returns dates as plain numbers)
+            parsed = pd.to_datetime(df[column], unit='D', origin='1899-12-30', errors='coerce')
+        else:
+            parsed = pd.to_datetime(df[column], errors='coerce', **DATE_FORMAT_KWARGS)
+            # Leave text columns alone unless every value is a date
+            if parsed.notna().sum() < df[column].notna().sum():
+                continue
+        # Same resolution as the sheet's other datetime columns
+        df[column] = parsed.astype(f'datetime64[{date_unit}]') if DTYPE_BACKEND_KWARGS else parsed
+    
+    df = _stringify_mixed_columns(df)
+    if DTYPE_BACKEND_KWARGS:
+        # Same column types as pd.read_excel(..., dtype_backend="pyarrow");
+        # columns that are already Arrow-backed are left as they are
+        numpy_columns = [column for column, kind in df.dtypes.items() if not isinstance(kind, pd.ArrowDtype)]
+        if len(numpy_columns) == len(df.columns):
+            df = pa.Table.from_pandas(df, preserve_index=False).to_pandas(types_mapper=pd.ArrowDtype)
+        elif numpy_columns:
+            converted = pa.Table.from_pandas(df[numpy_columns], preserve_index=False).to_pandas(types_mapper=pd.ArrowDtype)
+            converted.index = df.index
+            df[numpy_columns] = converted
+    
+    return df
+
+def _source_metadata(source_path: Path) -> Dict[bytes, bytes]:
+    """Identify a raw file by its resolved path and modification time (Parquet schema metadata)."""
+    return {
+        b"source_path": str(source_path.resolve()).encode(),
+        b"source_mtime_ns": str(source_path.stat().st_mtime_ns).encode(),
+    }
+
 class DataLoader:
     """Load and manage financial inclusion data from Excel files."""
     
-    def __init__(self, data_dir: str = "./data"):
+    def __init__(self, data_dir: str = "./data", verbose: bool = False):
         """
         Initialize DataLoader with data directory.
         
@@ -25,8 +279,15 @@ class DataLoader:
         -----------
         data_dir : str
             Path to data directory
+        verbose : bool
+            Log column lists and sample rows of each loaded dataset at INFO
+            (otherwise they are only logged at DEBUG)
         """
         self.data_dir = Path(data_dir)
+        self.verbose = verbose
+        # Column lists and sample rows are logged at INFO for a verbose loader
+        # and at DEBUG otherwise; the shared module logger is left as it is
+        self._detail_level = logging.INFO if verbose else logging.DEBUG
         self.raw_dir = self.data_dir / "raw"
         self.processed_dir = self.data_dir / "processed"
         
@@ -41,8 +302,90 @@ class DataLoader:
             "additional_data": "Additional Data Points Guide.xlsx"
         }
         
-        logger.info(f"DataLoader initialized with data directory: {data_dir}")
-        logger.info(f"Looking for Excel files: {list(self.data_files.values())}")
+        # Use the Rust-based calamine reader for pd.read_excel when it is
+        # installed (pandas >= 2.2); None falls back to EXCEL_ENGINES
+        try:
+            import python_calamine  # noqa: F401
+            calamine_supported = tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+            self._excel_engine: Optional[str] = "calamine" if calamine_supported else None
+        except ImportError:
+            self._excel_engine = None
+        
+        # Candidate paths per dataset (.xlsx, .xlsb export, .csv), built once
+        self._resolved_paths: Dict[str, Tuple[Path, Path, Path]] = {}
+        for name, filename in self.data_files.items():
+            excel_path = self.raw_dir / filename
+            self._resolved_paths[name] = (excel_path, excel_path.with_suffix('.xlsb'), excel_path.with_suffix('.csv'))
+        
+        # Resolved data file paths, filled on the first download_data() call
+        self._file_paths_cache: Optional[Dict[str, Path]] = None
+        
+        logger.info("DataLoader initialized with data directory: %s", data_dir)
+        logger.info("Looking for Excel files: %s", list(self.data_files.values()))
+    
+    def _raw_cache_path(self, name: str) -> Path:
+        """Path of the Parquet copy of a raw sheet (kept apart from processed outputs)."""
+        return self.processed_dir / ".cache" / f"{name}.raw.parquet"
+    
+    def _read_parquet_cache(self, name: str, source_path: Path) -> Optional[pd.DataFrame]:
+        """
+        Read the Parquet copy of a raw sheet if it was built from source_path as it is now.
+        
+        Parameters:
+        -----------
+        name : str
+            Dataset name (key of self.data_files)
+        source_path : Path
+            Raw file the cache was built from
+            
+        Returns:
+        --------
+        Optional[pd.DataFrame]
+            Cached dataframe, or None if the cache is missing or stale
+        """
+        cache_path = self._raw_cache_path(name)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            # The cache records its source file; a different file or a newer
+            # copy of the same file (different mtime) invalidates it
+            metadata = pq.read_schema(cache_path).metadata or {}
+            expected = _source_metadata(source_path)
+            if any(metadata.get(key) != value for key, value in expected.items()):
+                logger.info("♻️  Parquet cache %s is stale, reloading %s", cache_path, source_path.name)
+                return None
+            df = pd.read_parquet(cache_path, engine="pyarrow", **DTYPE_BACKEND_KWARGS)
+        except Exception as e:
+            logger.warning("⚠️  Could not read Parquet cache %s: %s", cache_path, e)
+            return None
+        
+        logger.info("⚡ Loaded from Parquet cache: %s", cache_path)
+        return df
+    
+    def _write_parquet_cache(self, df: pd.DataFrame, name: str, source_path: Path) -> None:
+        """
+        Write a Parquet copy of a raw sheet so later loads skip Excel parsing.
+        
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Sheet as read from the raw file
+        name : str
+            Dataset name (key of self.data_files)
+        source_path : Path
+            Raw file the sheet was read from, recorded in the Parquet metadata
+        """
+        cache_path = self._raw_cache_path(name)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                                   **_source_metadata(source_path)})
+            pq.write_table(table, cache_path, compression="zstd")
+            logger.info("💾 Cached %s to %s", name, cache_path)
+        except Exception as e:
+            logger.warning("⚠️  Could not write Parquet cache %s: %s", cache_path, e)
     
     def check_data_files(self) -> Dict[str, bool]:
         """
@@ -53,19 +396,17 @@ class DataLoader:
         Dict[str, bool]
             Dictionary mapping file names to existence status
         """
+        file_paths = self.download_data()
         file_status = {}
         
-        for name, filename in self.data_files.items():
-            file_path = self.raw_dir / filename
-            csv_path = self.raw_dir / filename.replace('.xlsx', '.csv')
-            
-            exists = file_path.exists() or csv_path.exists()
+        for name in self.data_files:
+            exists = name in file_paths
             file_status[name] = exists
             
             if exists:
-                logger.info(f"✅ Data file found for {name}")
+                logger.info("✅ Data file found for %s", name)
             else:
-                logger.warning(f"❌ Data file not found for {name}")
+                logger.warning("❌ Data file not found for %s", name)
         
         return file_status
     
@@ -73,42 +414,50 @@ class DataLoader:
         """
         Check for local data files.
         
+        Resolved paths are cached on the instance, so repeated calls (one per
+        load_* method) don't re-scan the raw directory.
+        
         Parameters:
         -----------
         force_download : bool
-            Not used for local files, kept for compatibility
+            Re-scan the raw directory even if paths are already cached
             
         Returns:
         --------
         Dict[str, Path]
             Dictionary mapping dataset names to file paths
         """
+        if self._file_paths_cache is not None and not force_download:
+            return self._file_paths_cache
+        
         file_paths = {}
         
-        for name, filename in self.data_files.items():
-            # Try Excel file first
-            excel_path = self.raw_dir / filename
-            csv_path = self.raw_dir / filename.replace('.xlsx', '.csv')
-            
+        for name, (excel_path, xlsb_path, csv_path) in self._resolved_paths.items():
+            # Try Excel file first (.xlsx, then a binary .xlsb export, so a
+            # stale export never shadows the workbook)
             if excel_path.exists():
-                logger.info(f"Found Excel file: {excel_path}")
+                logger.info("Found Excel file: %s", excel_path)
                 file_paths[name] = excel_path
+            elif xlsb_path.exists():
+                logger.info("Found Excel binary file: %s", xlsb_path)
+                file_paths[name] = xlsb_path
             elif csv_path.exists():
-                logger.info(f"Found CSV file: {csv_path}")
+                logger.info("Found CSV file: %s", csv_path)
                 file_paths[name] = csv_path
             else:
-                logger.error(f"No data file found for: {name}")
-                logger.error(f"Expected at: {excel_path} or {csv_path}")
+                logger.error("No data file found for: %s", name)
+                logger.error("Expected at: %s, %s or %s", excel_path, xlsb_path, csv_path)
         
         # Log summary
         if file_paths:
-            logger.info(f"✅ Found {len(file_paths)} data file(s)")
+            logger.info("✅ Found %s data file(s)", len(file_paths))
             for name, path in file_paths.items():
-                logger.info(f"   {name}: {path.name}")
+                logger.info("   %s: %s", name, path.name)
         else:
             logger.error("❌ No data files found!")
-            logger.error(f"Please place Excel files in: {self.raw_dir}")
+            logger.error("Please place Excel files in: %s", self.raw_dir)
         
+        self._file_paths_cache = file_paths
         return file_paths
     
     def load_unified_data(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -132,57 +481,107 @@ class DataLoader:
                 )
             
             # Load the file
-            logger.info(f"Loading unified data from {unified_data_path}")
+            logger.info("Loading unified data from %s", unified_data_path)
             
             # Check file type and load accordingly
             file_extension = unified_data_path.suffix.lower()
             
-            if file_extension == '.xlsx':
-                # Read Excel file
-                excel_file = pd.ExcelFile(unified_data_path)
-                sheet_names = excel_file.sheet_names
-                logger.info(f"📂 Excel sheets available: {sheet_names}")
-                
-                # Try to find the right sheet
-                df = None
-                sheet_used = None
-                
-                # Common possible sheet names
-                possible_sheet_names = [
-                    'data', 'Sheet1', 'unified_data', 
-                    'ethiopia_fi', 'main', 'observations'
-                ]
-                
-                for sheet_name in possible_sheet_names:
-                    if sheet_name in sheet_names:
-                        df = pd.read_excel(unified_data_path, sheet_name=sheet_name)
-                        sheet_used = sheet_name
-                        logger.info(f"📊 Loaded from sheet: '{sheet_name}'")
-                        break
+            # Reuse the Parquet copy from an earlier load if the source hasn't changed
+            cached_df = self._read_parquet_cache("unified_data", unified_data_path) if file_extension in EXCEL_ENGINES else None
+            
+            # Read the file into memory once; the header probes and full reads
+            # below all work on this buffer instead of reopening the file
+            buffer = io.BytesIO(unified_data_path.read_bytes()) if cached_df is None else None
+            
+            if cached_df is not None:
+                df = cached_df
+            elif file_extension == '.xlsx' and self._excel_engine is None:
+                # Stream sheets from one read-only workbook (rows are parsed
+                # lazily instead of building the whole workbook in memory)
+                with closing(openpyxl.load_workbook(buffer, read_only=True, data_only=True)) as workbook:
+                    sheet_names = workbook.sheetnames
+                    logger.info("📂 Excel sheets available: %s", sheet_names)
+                    
+                    # Try to find the right sheet
+                    df = None
+                    sheet_used = None
+                    
+                    # Common possible sheet names
+                    for sheet_name in UNIFIED_SHEET_NAMES:
+                        if sheet_name in sheet_names:
+                            df = _read_sheet_fast(workbook, sheet_name, dtype=UNIFIED_DTYPES,
+                                                  parse_dates=UNIFIED_DATE_COLUMNS)
+                            sheet_used = sheet_name
+                            logger.info("📊 Loaded from sheet: '%s'", sheet_name)
+                            break
+                    
+                    # If no common sheet found, try sheets with data
+                    if df is None:
+                        for sheet_name in sheet_names:
+                            try:
+                                # Header-only probe; the sheet is parsed in full only on a match
+                                temp_df = _read_sheet_fast(workbook, sheet_name, nrows=0)
+                                # Check if this looks like our data (has record_type or similar)
+                                if 'record_type' in temp_df.columns or 'indicator' in temp_df.columns:
+                                    df = _read_sheet_fast(workbook, sheet_name, dtype=UNIFIED_DTYPES,
+                                                          parse_dates=UNIFIED_DATE_COLUMNS)
+                                    sheet_used = sheet_name
+                                    logger.info("📊 Loaded from sheet (detected): '%s'", sheet_name)
+                                    break
+                            except (ValueError, KeyError, TypeError, pd.errors.ParserError):
+                                continue
+                    
+                    # Last resort: use first sheet
+                    if df is None and sheet_names:
+                        df = _read_sheet_fast(workbook, sheet_names[0], dtype=UNIFIED_DTYPES,
+                                              parse_dates=UNIFIED_DATE_COLUMNS)
+                        sheet_used = sheet_names[0]
+                        logger.info("📊 Loaded from first sheet: '%s'", sheet_used)
                 
-                # If no common sheet found, try sheets with data
-                if df is None:
-                    for sheet_name in sheet_names:
-                        try:
-                            temp_df = pd.read_excel(unified_data_path, sheet_name=sheet_name, nrows=10)
-                            # Check if this looks like our data (has record_type or similar)
-                            if 'record_type' in temp_df.columns or 'indicator' in temp_df.columns:
-                                df = pd.read_excel(unified_data_path, sheet_name=sheet_name)
+                if df is not None and not df.empty:
+                    self._write_parquet_cache(df, "unified_data", unified_data_path)
+            
+            elif file_extension in EXCEL_ENGINES:
+                # .xlsb via pyxlsb, or any workbook via calamine when installed
+                with pd.ExcelFile(buffer, engine=self._excel_engine or EXCEL_ENGINES[file_extension]) as xf:
+                    sheet_names = xf.sheet_names
+                    logger.info("📂 Excel sheets available: %s", sheet_names)
+                    
+                    # Same sheet choice as for .xlsx: known name, then detected by header, then first
+                    sheet_used = next((name for name in UNIFIED_SHEET_NAMES if name in sheet_names), None)
+                    if sheet_used is None:
+                        for sheet_name in sheet_names:
+                            try:
+                                header = pd.read_excel(xf, sheet_name=sheet_name, nrows=0).columns
+                            except (ValueError, KeyError, TypeError, pd.errors.ParserError):
+                                continue
+                            if 'record_type' in header or 'indicator' in header:
                                 sheet_used = sheet_name
-                                logger.info(f"📊 Loaded from sheet (detected): '{sheet_name}'")
                                 break
-                        except:
-                            continue
+                        else:
+                            sheet_used = sheet_names[0]
+                    
+                    df = _finalize_frame(pd.read_excel(xf, sheet_name=sheet_used),
+                                         dtype=UNIFIED_DTYPES, parse_dates=UNIFIED_DATE_COLUMNS)
+                    logger.info("📊 Loaded from sheet: '%s'", sheet_used)
                 
-                # Last resort: use first sheet
-                if df is None and sheet_names:
-                    df = pd.read_excel(unified_data_path, sheet_name=sheet_names[0])
-                    sheet_used = sheet_names[0]
-                    logger.info(f"📊 Loaded from first sheet: '{sheet_used}'")
+                if not df.empty:
+                    self._write_parquet_cache(df, "unified_data", unified_data_path)
                     
             elif file_extension == '.csv':
-                # Read CSV file
-                df = pd.read_csv(unified_data_path)
+                df = _read_csv_polars(buffer, unified_data_path.name)
+                if df is None:
+                    # Read CSV file, typing known columns at parse time
+                    buffer.seek(0)
+                    header = pd.read_csv(buffer, nrows=0).columns
+                    buffer.seek(0)
+                    df = pd.read_csv(
+                        buffer,
+                        dtype={column: kind for column, kind in UNIFIED_DTYPES.items() if column in header}
+                    )
+                # Same column types as the Excel readers, whichever CSV reader ran
+                # (date columns are parsed here, only where every value is a date)
+                df = _finalize_frame(df, dtype=UNIFIED_DTYPES, parse_dates=UNIFIED_DATE_COLUMNS)
                 logger.info("📊 Loaded from CSV file")
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
@@ -190,12 +589,14 @@ class DataLoader:
             if df is None or df.empty:
                 raise ValueError("Loaded dataframe is empty")
             
-            logger.info(f"✅ Raw data loaded. Shape: {df.shape}")
-            logger.info(f"📋 Columns: {df.columns.tolist()}")
+            logger.info("✅ Raw data loaded. Shape: %s", df.shape)
+            if logger.isEnabledFor(self._detail_level):
+                logger.log(self._detail_level, "📋 Columns: %s", df.columns.tolist())
             
-            # Clean column names (strip whitespace, lowercase)
-            df.columns = df.columns.str.strip().str.lower()
-            logger.info(f"🔧 Cleaned columns: {df.columns.tolist()}")
+            # Clean column names (strip whitespace, lowercase) in one pass
+            df.columns = [column.strip().lower() if isinstance(column, str) else column for column in df.columns]
+            if logger.isEnabledFor(self._detail_level):
+                logger.log(self._detail_level, "🔧 Cleaned columns: %s", df.columns.tolist())
             
             # Check for required columns
             required_columns = ['record_type']
@@ -204,32 +605,31 @@ class DataLoader:
             missing_columns = [col for col in required_columns if col not in available_columns]
             
             if missing_columns:
-                logger.warning(f"⚠️  Missing expected columns: {missing_columns}")
-                logger.info(f"📋 Available columns: {available_columns}")
+                logger.warning("⚠️  Missing expected columns: %s", missing_columns)
+                logger.log(self._detail_level, "📋 Available columns: %s", available_columns)
                 
                 # Try to find similar columns
                 for missing_col in missing_columns:
                     similar_cols = [col for col in available_columns if missing_col in col]
                     if similar_cols:
-                        logger.info(f"   Similar to '{missing_col}': {similar_cols}")
+                        logger.info("   Similar to '%s': %s", missing_col, similar_cols)
             
             # Split into main data and impact links if 'record_type' exists
             if 'record_type' in df.columns:
-                # Clean record_type values
-                df['record_type'] = df['record_type'].astype(str).str.strip().str.lower()
+                # Clean record_type values (typed as string at read time; the
+                # cast only runs if the raw header didn't match exactly)
+                if not pd.api.types.is_string_dtype(df['record_type']):
+                    df['record_type'] = df['record_type'].astype("string")
+                df['record_type'] = df['record_type'].str.strip().str.lower()
                 
-                # Split data
+                # Split data (reset_index already returns new frames, so no .copy())
                 impact_links_mask = df['record_type'] == 'impact_link'
-                main_data = df[~impact_links_mask].copy()
-                impact_links = df[impact_links_mask].copy()
+                main_data = df.loc[~impact_links_mask].reset_index(drop=True)
+                impact_links = df.loc[impact_links_mask].reset_index(drop=True)
                 
-                logger.info(f"✅ Split data:")
-                logger.info(f"   Main data records: {len(main_data)}")
-                logger.info(f"   Impact link records: {len(impact_links)}")
-                
-                # Reset indices
-                main_data = main_data.reset_index(drop=True)
-                impact_links = impact_links.reset_index(drop=True)
+                logger.info("✅ Split data:")
+                logger.info("   Main data records: %s", len(main_data))
+                logger.info("   Impact link records: %s", len(impact_links))
                 
             else:
                 # If no record_type, assume all is main data
@@ -237,19 +637,18 @@ class DataLoader:
                 main_data = df.copy()
                 impact_links = pd.DataFrame()
             
-            # Display sample of each type
-            if not main_data.empty:
-                logger.info(f"\n📄 MAIN DATA SAMPLE (first 3 rows):")
-                print(main_data.head(3).to_string())
-            
-            if not impact_links.empty:
-                logger.info(f"\n🔗 IMPACT LINKS SAMPLE (first 3 rows):")
-                print(impact_links.head(3).to_string())
+            # Display sample of each type (formatting is skipped unless debugging)
+            if logger.isEnabledFor(self._detail_level):
+                if not main_data.empty:
+                    logger.log(self._detail_level, "\n📄 MAIN DATA SAMPLE (first 3 rows):\n%s", main_data.head(3).to_string())
+                
+                if not impact_links.empty:
+                    logger.log(self._detail_level, "\n🔗 IMPACT LINKS SAMPLE (first 3 rows):\n%s", impact_links.head(3).to_string())
             
             return main_data, impact_links
             
         except Exception as e:
-            logger.error(f"❌ Error loading unified data: {e}")
+            logger.error("❌ Error loading unified data: %s", e)
             logger.error("Please check:")
             logger.error("1. File exists in data/raw/ folder")
             logger.error("2. File is not open in Excel")
@@ -275,54 +674,81 @@ class DataLoader:
                     f"in {self.raw_dir}"
                 )
             
-            logger.info(f"Loading reference codes from {ref_codes_path}")
+            logger.info("Loading reference codes from %s", ref_codes_path)
             
             # Load file based on extension
             file_extension = ref_codes_path.suffix.lower()
             
-            if file_extension == '.xlsx':
-                # Try to read Excel
-                excel_file = pd.ExcelFile(ref_codes_path)
-                sheet_names = excel_file.sheet_names
-                logger.info(f"Excel sheets: {sheet_names}")
-                
-                # Try common sheet names
-                possible_sheet_names = ['reference_codes', 'codes', 'Sheet1', 'ref']
-                ref_codes = None
+            # Reuse the Parquet copy from an earlier load if the source hasn't changed
+            cached_ref_codes = self._read_parquet_cache("reference_codes", ref_codes_path) if file_extension in EXCEL_ENGINES else None
+            
+            if cached_ref_codes is not None:
+                ref_codes = cached_ref_codes
+            elif file_extension == '.xlsx' and self._excel_engine is None:
+                # Stream sheets from one read-only workbook (rows are parsed
+                # lazily instead of building the whole workbook in memory)
+                with closing(openpyxl.load_workbook(ref_codes_path, read_only=True, data_only=True)) as workbook:
+                    sheet_names = workbook.sheetnames
+                    logger.info("Excel sheets: %s", sheet_names)
+                    
+                    # Try common sheet names
+                    possible_sheet_names = ['reference_codes', 'codes', 'Sheet1', 'ref']
+                    ref_codes = None
+                    
+                    for sheet_name in possible_sheet_names:
+                        if sheet_name in sheet_names:
+                            ref_codes = _read_sheet_fast(workbook, sheet_name)
+                            logger.info("Loaded from sheet: '%s'", sheet_name)
+                            break
+                    
+                    # Use first sheet if none matched
+                    if ref_codes is None and sheet_names:
+                        ref_codes = _read_sheet_fast(workbook, sheet_names[0])
+                        logger.info("Loaded from first sheet: '%s'", sheet_names[0])
                 
-                for sheet_name in possible_sheet_names:
-                    if sheet_name in sheet_names:
-                        ref_codes = pd.read_excel(ref_codes_path, sheet_name=sheet_name)
-                        logger.info(f"Loaded from sheet: '{sheet_name}'")
-                        break
+                if ref_codes is not None and not ref_codes.empty:
+                    self._write_parquet_cache(ref_codes, "reference_codes", ref_codes_path)
+            
+            elif file_extension in EXCEL_ENGINES:
+                # .xlsb via pyxlsb, or any workbook via calamine when installed
+                with pd.ExcelFile(ref_codes_path, engine=self._excel_engine or EXCEL_ENGINES[file_extension]) as xf:
+                    sheet_names = xf.sheet_names
+                    logger.info("Excel sheets: %s", sheet_names)
+                    
+                    possible_sheet_names = ['reference_codes', 'codes', 'Sheet1', 'ref']
+                    sheet_used = next((name for name in possible_sheet_names if name in sheet_names), sheet_names[0])
+                    ref_codes = _finalize_frame(pd.read_excel(xf, sheet_name=sheet_used))
+                    logger.info("Loaded from sheet: '%s'", sheet_used)
                 
-                # Use first sheet if none matched
-                if ref_codes is None and sheet_names:
-                    ref_codes = pd.read_excel(ref_codes_path, sheet_name=sheet_names[0])
-                    logger.info(f"Loaded from first sheet: '{sheet_names[0]}'")
+                if not ref_codes.empty:
+                    self._write_parquet_cache(ref_codes, "reference_codes", ref_codes_path)
                     
             elif file_extension == '.csv':
-                ref_codes = pd.read_csv(ref_codes_path)
+                ref_codes = _read_csv_polars(ref_codes_path, ref_codes_path.name)
+                if ref_codes is None:
+                    ref_codes = pd.read_csv(ref_codes_path)
+                ref_codes = _finalize_frame(ref_codes)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
             
             if ref_codes is None or ref_codes.empty:
                 raise ValueError("Loaded reference codes dataframe is empty")
             
-            logger.info(f"✅ Reference codes loaded. Shape: {ref_codes.shape}")
-            logger.info(f"📋 Columns: {ref_codes.columns.tolist()}")
+            logger.info("✅ Reference codes loaded. Shape: %s", ref_codes.shape)
+            if logger.isEnabledFor(self._detail_level):
+                logger.log(self._detail_level, "📋 Columns: %s", ref_codes.columns.tolist())
             
             # Clean column names
-            ref_codes.columns = ref_codes.columns.str.strip().str.lower()
+            ref_codes.columns = [column.strip().lower() if isinstance(column, str) else column for column in ref_codes.columns]
             
-            # Display sample
-            logger.info(f"\n📄 REFERENCE CODES SAMPLE (first 5 rows):")
-            print(ref_codes.head().to_string())
+            # Display sample (formatting is skipped unless debugging)
+            if logger.isEnabledFor(self._detail_level):
+                logger.log(self._detail_level, "\n📄 REFERENCE CODES SAMPLE (first 5 rows):\n%s", ref_codes.head().to_string())
             
             return ref_codes
             
         except Exception as e:
-            logger.error(f"❌ Error loading reference codes: {e}")
+            logger.error("❌ Error loading reference codes: %s", e)
             raise
     
     def load_additional_data_guide(self) -> Dict[str, pd.DataFrame]:
@@ -345,23 +771,19 @@ class DataLoader:
                     f"in {self.raw_dir}"
                 )
             
-            logger.info(f"Loading additional data guide from {guide_path}")
+            logger.info("Loading additional data guide from %s", guide_path)
             
             # Check file type
             file_extension = guide_path.suffix.lower()
             
-            if file_extension == '.xlsx':
-                # Read all sheets
-                excel_file = pd.ExcelFile(guide_path)
-                sheet_names = excel_file.sheet_names
-                
-                logger.info(f"📂 Guide sheets available: {sheet_names}")
+            if file_extension in EXCEL_ENGINES:
+                # Read all sheets from a single open workbook in one call
+                with pd.ExcelFile(guide_path, engine=self._excel_engine or EXCEL_ENGINES[file_extension]) as xf:
+                    logger.info("📂 Guide sheets available: %s", xf.sheet_names)
+                    sheets_dict = pd.read_excel(xf, sheet_name=None, **DTYPE_BACKEND_KWARGS)
                 
-                # Load all sheets into dictionary
-                sheets_dict = {}
-                for sheet_name in sheet_names:
-                    sheets_dict[sheet_name] = pd.read_excel(guide_path, sheet_name=sheet_name)
-                    logger.info(f"   Loaded sheet: '{sheet_name}' - Shape: {sheets_dict[sheet_name].shape}")
+                for sheet_name, sheet_df in sheets_dict.items():
+                    logger.info("   Loaded sheet: '%s' - Shape: %s", sheet_name, sheet_df.shape)
                 
                 return sheets_dict
                 
@@ -369,10 +791,41 @@ class DataLoader:
                 raise ValueError(f"Unsupported file format for guide: {file_extension}")
             
         except Exception as e:
-            logger.error(f"❌ Error loading additional data guide: {e}")
+            logger.error("❌ Error loading additional data guide: %s", e)
             return {}
     
-    def validate_data_structure(self, df: pd.DataFrame) -> Dict[str, any]:
+    def load_all(self) -> Dict[str, Any]:
+        """
+        Load the unified data, reference codes and data guide concurrently.
+        
+        The three workbooks are independent, so they are read on a small
+        thread pool to overlap file I/O and XML parsing.
+        
+        Returns:
+        --------
+        Dict[str, Any]
+            Dictionary with 'main_data', 'impact_links', 'reference_codes'
+            and 'additional_data' entries
+        """
+        # Resolve file paths once up front so the workers share the cache
+        self.download_data()
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            unified_future = executor.submit(self.load_unified_data)
+            ref_codes_future = executor.submit(self.load_reference_codes)
+            guide_future = executor.submit(self.load_additional_data_guide)
+            
+            main_data, impact_links = unified_future.result()
+            
+            return {
+                "main_data": main_data,
+                "impact_links": impact_links,
+                "reference_codes": ref_codes_future.result(),
+                "additional_data": guide_future.result()
+            }
+    
+    def validate_data_structure(self, df: pd.DataFrame,
+                                missing_cols: Optional[List[str]] = None) -> Dict[str, any]:
         """
         Validate the structure and completeness of the data.
         
@@ -380,6 +833,9 @@ class DataLoader:
         -----------
         df : pd.DataFrame
             Dataframe to validate
+        missing_cols : Optional[List[str]]
+            Columns to count missing values for (defaults to the key columns
+            record_type, pillar and indicator_code, where present)
             
         Returns:
         --------
@@ -407,8 +863,10 @@ class DataLoader:
         if 'pillar' in df.columns:
             validation_results["pillar_distribution"] = df['pillar'].value_counts().to_dict()
         
-        # Missing values
-        validation_results["missing_values"] = df.isnull().sum().to_dict()
+        # Missing values (only for the requested columns, not the whole frame)
+        if missing_cols is None:
+            missing_cols = [col for col in ('record_type', 'pillar', 'indicator_code') if col in df.columns]
+        validation_results["missing_values"] = {col: int(df[col].isna().sum()) for col in missing_cols}
         
         # Unique indicators
         if 'indicator_code' in df.columns:
@@ -419,20 +877,23 @@ class DataLoader:
         if date_columns:
             for date_col in date_columns:
                 try:
-                    df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
-                    valid_dates = df[date_col].dropna()
+                    # Convert into a local (leaving df untouched), and only if needed
+                    if pd.api.types.is_datetime64_any_dtype(df[date_col]):
+                        valid_dates = df[date_col].dropna()
+                    else:
+                        valid_dates = pd.to_datetime(df[date_col], errors='coerce').dropna()
                     if not valid_dates.empty:
                         validation_results["date_range"] = {
                             "min": valid_dates.min().strftime('%Y-%m-%d'),
                             "max": valid_dates.max().strftime('%Y-%m-%d')
                         }
                         break
-                except:
+                except (ValueError, TypeError):
                     continue
         
         return validation_results
     
-    def save_processed_data(self, df: pd.DataFrame, filename: str) -> Path:
+    def save_processed_data(self, df: pd.DataFrame, filename: str, fmt: Optional[str] = None) -> Path:
         """
         Save processed data to processed directory.
         
@@ -441,23 +902,65 @@ class DataLoader:
         df : pd.DataFrame
             Dataframe to save
         filename : str
-            Name of the file (without directory)
+            Name of the file (without directory); a .csv or .parquet suffix
+            selects the format
+        fmt : Optional[str]
+            'parquet' (zstd-compressed) or 'csv'. Defaults to the filename's
+            suffix, or 'parquet' if it has none
             
         Returns:
         --------
         Path
             Path to saved file
         """
-        file_path = self.processed_dir / filename
+        suffix = Path(filename).suffix.lower()
+        explicit_fmt = suffix[1:] if suffix in (".csv", ".parquet") else None
         
-        # Ensure filename ends with .csv
-        if not filename.endswith('.csv'):
-            filename += '.csv'
-            file_path = self.processed_dir / filename
+        if fmt is None:
+            fmt = explicit_fmt or "parquet"
+        if fmt not in ("parquet", "csv"):
+            raise ValueError(f"Unsupported format: {fmt}")
+        if explicit_fmt is not None and explicit_fmt != fmt:
+            raise ValueError(f"Filename {filename!r} does not match format {fmt!r}")
         
-        df.to_csv(file_path, index=False)
-        logger.info(f"💾 Saved processed data to {file_path}")
+        # Ensure filename ends with the extension for the format
+        if explicit_fmt is None:
+            filename += f".{fmt}"
+        file_path = self.processed_dir / filename
+        
+        if fmt == "parquet":
+            df.to_parquet(file_path, compression="zstd", engine="pyarrow", index=False)
+        else:
+            df.to_csv(file_path, index=False)
+        logger.info("💾 Saved processed data to %s", file_path)
         return file_path
+    
+    def load_processed_data(self, filename: str) -> pd.DataFrame:
+        """
+        Load a file saved by save_processed_data, choosing the reader from its suffix.
+        
+        Parameters:
+        -----------
+        filename : str
+            Name of the file in the processed directory (.parquet or .csv)
+            
+        Returns:
+        --------
+        pd.DataFrame
+            Loaded dataframe
+        """
+        file_path = self.processed_dir / filename
+        file_extension = file_path.suffix.lower()
+        
+        if file_extension == '.parquet':
+            df = pd.read_parquet(file_path, engine="pyarrow", **DTYPE_BACKEND_KWARGS)
+        elif file_extension == '.csv':
+            df = pd.read_csv(file_path, **DTYPE_BACKEND_KWARGS)
+        else:
+            raise ValueError(f"Unsupported file format: {file_extension}")
+        
+        logger.info("📂 Loaded processed data from %s. Shape: %s", file_path, df.shape)
+        return df
 
 # Helper function to display data summary
 def display_data_summary(main_data: pd.DataFrame, impact_links: pd.DataFrame) -> None:
@@ -519,7 +1022,7 @@ if __name__ == "__main__":
     
     try:
         # Initialize DataLoader
-        loader = DataLoader()
+        loader = DataLoader(verbose=True)
         
         # Check which files exist
         print("\n🔍 Checking for data files...")
@@ -529,20 +1032,20 @@ if __name__ == "__main__":
             status = "✅" if exists else "❌"
             print(f"   {status} {file_name}: {exists}")
         
-        # Load unified data
-        print("\n📥 Loading unified data...")
-        main_data, impact_links = loader.load_unified_data()
+        # Load all data files concurrently
+        print("\n📥 Loading unified data, reference codes and data guide...")
+        loaded = loader.load_all()
+        main_data, impact_links = loaded["main_data"], loaded["impact_links"]
         
         # Display summary
         display_data_summary(main_data, impact_links)
         
-        # Load reference codes
-        print("\n📋 Loading reference codes...")
-        ref_codes = loader.load_reference_codes()
+        # Reference codes
+        print(f"\n📋 Reference codes: {len(loaded['reference_codes']):,} rows")
         
-        # Load additional data guide
-        print("\n📚 Loading additional data guide...")
-        guide_sheets = loader.load_additional_data_guide()
+        # Additional data guide
+        print("\n📚 Additional data guide:")
+        guide_sheets = loaded["additional_data"]
         if guide_sheets:
             print(f"   Loaded {len(guide_sheets)} sheet(s): {list(guide_sheets.keys())}")
         
@@ -0,0 +1,264 @@
+"""
+Tests for src/data_loader.py: the Excel fast path, Parquet cache, CSV readers and processed-data files.
+"""
+
+import io
+import logging
+import os
+import shutil
+import sys
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.data_loader as data_loader
+from src.data_loader import (
+    DEFAULT_DATETIME_UNIT,
+    UNIFIED_DATE_COLUMNS,
+    UNIFIED_DTYPES,
+    DataLoader,
+    _finalize_frame,
+    _read_sheet_fast,
+)
+
+RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
+RAW_WORKBOOKS = sorted(RAW_DIR.glob("*.xlsx"))
+
+pytestmark = pytest.mark.skipif(not RAW_WORKBOOKS, reason="raw workbooks not available")
+
+
+def _sheets():
+    """List (workbook path, sheet name) pairs for every raw workbook."""
+    pairs = []
+    for path in RAW_WORKBOOKS:
+        with closing(openpyxl.load_workbook(path, read_only=True)) as workbook:
+            pairs.extend((path, sheet_name) for sheet_name in workbook.sheetnames)
+    return pairs
+
+
+@pytest.mark.parametrize("path,sheet_name", _sheets(), ids=lambda value: getattr(value, "name", value))
+def test_read_sheet_fast_matches_read_excel(path, sheet_name):
+    with closing(openpyxl.load_workbook(path, read_only=True, data_only=True)) as workbook:
+        fast = _read_sheet_fast(workbook, sheet_name)
+
+    expected = _finalize_frame(pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl"))
+    pd.testing.assert_frame_equal(fast, expected)
+
+
+def test_read_sheet_fast_matches_read_excel_with_types():
+    path = RAW_DIR / "ethiopia_fi_unified_data.xlsx"
+    with closing(openpyxl.load_workbook(path, read_only=True, data_only=True)) as workbook:
+        sheet_name = workbook.sheetnames[0]
+        fast = _read_sheet_fast(workbook, sheet_name, dtype=UNIFIED_DTYPES,
+                                parse_dates=UNIFIED_DATE_COLUMNS)
+
+    expected = _finalize_frame(pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl"),
+                               dtype=UNIFIED_DTYPES, parse_dates=UNIFIED_DATE_COLUMNS)
+    pd.testing.assert_frame_equal(fast, expected)
+
+
+def _datetime_unit(series):
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return dtype.pyarrow_dtype.unit
+    return getattr(dtype, "unit", None) or np.datetime_data(dtype)[0]
+
+
+def test_parsed_dates_match_unit_of_other_datetime_columns():
+    df = pd.DataFrame({
+        "observation_date": pd.to_datetime(["2021-01-01", "2022-01-01"]).astype("datetime64[ms]"),
+        "period_start": [44197.0, 44562.0],
+        "period_end": ["2021-12-31", "2022-12-31"],
+    })
+
+    result = _finalize_frame(df, parse_dates=("observation_date", "period_start", "period_end"))
+
+    assert [_datetime_unit(result[column]) for column in result.columns] == ["ms", "ms", "ms"]
+
+
+def test_parsed_dates_match_unit_of_excel_dates():
+    path = RAW_DIR / "ethiopia_fi_unified_data.xlsx"
+    excel_unit = _datetime_unit(pd.read_excel(path, engine="openpyxl")["observation_date"])
+
+    df = pd.DataFrame({"period_start": [44197.0], "period_end": ["2021-12-31"]})
+    result = _finalize_frame(df, parse_dates=("period_start", "period_end"))
+
+    assert DEFAULT_DATETIME_UNIT == excel_unit
+    assert [_datetime_unit(result[column]) for column in result.columns] == [excel_unit, excel_unit]
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """DataLoader on a copy of the raw workbooks, reading .xlsx via the openpyxl fast path."""
+    shutil.copytree(RAW_DIR, tmp_path / "raw")
+    loader = DataLoader(data_dir=str(tmp_path))
+    loader._excel_engine = None
+    return loader
+
+
+def _cache_path(loader):
+    return loader._raw_cache_path("unified_data")
+
+
+def _source_path(loader):
+    return loader.raw_dir / loader.data_files["unified_data"]
+
+
+def _write_sentinel_cache(loader, source_path):
+    """Write a one-row cache for source_path that differs from the workbook."""
+    sentinel = pd.DataFrame({"record_type": ["observation"], "indicator_code": ["CACHED"]})
+    loader._write_parquet_cache(sentinel, "unified_data", source_path)
+
+
+def test_missing_cache_loads_excel_and_writes_cache(loader):
+    assert not _cache_path(loader).exists()
+
+    main_data, impact_links = loader.load_unified_data()
+
+    assert len(main_data) > 0
+    assert _cache_path(loader).exists()
+
+    # A second load reads the cache it just wrote and gets the same frames
+    cached_main, cached_links = loader.load_unified_data()
+    pd.testing.assert_frame_equal(cached_main, main_data)
+    pd.testing.assert_frame_equal(cached_links, impact_links)
+
+
+def test_stale_cache_falls_back_to_excel(loader):
+    expected_main, expected_links = loader.load_unified_data()
+
+    _write_sentinel_cache(loader, _source_path(loader))
+    source_mtime = _source_path(loader).stat().st_mtime
+    os.utime(_source_path(loader), (source_mtime + 10, source_mtime + 10))
+
+    main_data, impact_links = loader.load_unified_data()
+
+    assert "CACHED" not in main_data["indicator_code"].tolist()
+    pd.testing.assert_frame_equal(main_data, expected_main)
+    pd.testing.assert_frame_equal(impact_links, expected_links)
+
+
+def test_fresh_cache_is_used(loader):
+    _write_sentinel_cache(loader, _source_path(loader))
+
+    main_data, impact_links = loader.load_unified_data()
+
+    assert main_data["indicator_code"].tolist() == ["CACHED"]
+    assert impact_links.empty
+
+
+def test_cache_from_another_source_is_ignored(loader):
+    # e.g. the cache was built from the .xlsx and the .xlsb export is loaded now
+    other_source = _source_path(loader).with_suffix(".xlsb")
+    shutil.copy2(_source_path(loader), other_source)
+    _write_sentinel_cache(loader, _source_path(loader))
+
+    assert loader._read_parquet_cache("unified_data", other_source) is None
+
+
+def test_save_processed_data_does_not_overwrite_cache(loader):
+    expected_main, expected_links = loader.load_unified_data()
+
+    summary = pd.DataFrame({"pillar": ["ACCESS", "USAGE", "QUALITY", "GENDER"], "records": [1, 2, 3, 4]})
+    loader.save_processed_data(summary, "unified_data")
+
+    main_data, impact_links = loader.load_unified_data()
+
+    pd.testing.assert_frame_equal(main_data, expected_main)
+    pd.testing.assert_frame_equal(impact_links, expected_links)
+
+
+@pytest.fixture
+def csv_loader(tmp_path):
+    """DataLoader on CSV exports of the raw workbooks."""
+    (tmp_path / "raw").mkdir()
+    for name in ("ethiopia_fi_unified_data", "reference_codes"):
+        pd.read_excel(RAW_DIR / f"{name}.xlsx").to_csv(tmp_path / "raw" / f"{name}.csv", index=False)
+    return DataLoader(data_dir=str(tmp_path))
+
+
+def test_polars_and_pandas_csv_readers_agree(csv_loader, monkeypatch):
+    pytest.importorskip("polars")
+
+    polars_frames = (*csv_loader.load_unified_data(), csv_loader.load_reference_codes())
+    monkeypatch.setattr(data_loader, "pl", None)
+    pandas_frames = (*csv_loader.load_unified_data(), csv_loader.load_reference_codes())
+
+    for polars_frame, pandas_frame in zip(polars_frames, pandas_frames):
+        pd.testing.assert_frame_equal(polars_frame, pandas_frame)
+
+
+def test_polars_csv_types_match_pandas_for_gappy_and_empty_columns():
+    pytest.importorskip("polars")
+    csv = b"lag_months,notes,indicator\n12,,ACC_OWNERSHIP\n,,USG_P2P_COUNT\n"
+
+    polars_frame = _finalize_frame(data_loader._read_csv_polars(io.BytesIO(csv), "test.csv"))
+    pandas_frame = _finalize_frame(pd.read_csv(io.BytesIO(csv)))
+
+    pd.testing.assert_frame_equal(polars_frame, pandas_frame)
+
+
+def test_finalize_frame_converts_xlsb_date_serials():
+    path = RAW_DIR / "ethiopia_fi_unified_data.xlsx"
+    sheet = pd.read_excel(path, engine="openpyxl")
+    expected = _finalize_frame(sheet.copy(), dtype=UNIFIED_DTYPES, parse_dates=UNIFIED_DATE_COLUMNS)
+
+    # pyxlsb returns date cells as plain day counts since 1899-12-30
+    date_columns = [column for column in UNIFIED_DATE_COLUMNS if column in sheet.columns]
+    for column in date_columns:
+        sheet[column] = (sheet[column] - pd.Timestamp("1899-12-30")) / pd.Timedelta(days=1)
+    result = _finalize_frame(sheet, dtype=UNIFIED_DTYPES, parse_dates=UNIFIED_DATE_COLUMNS)
+
+    assert date_columns
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("filename,fmt,saved_as", [
+    ("summary.csv", None, "summary.csv"),
+    ("summary.parquet", None, "summary.parquet"),
+    ("summary", None, "summary.parquet"),
+    ("summary", "csv", "summary.csv"),
+    ("summary.csv", "csv", "summary.csv"),
+])
+def test_save_processed_data_infers_format_from_suffix(tmp_path, filename, fmt, saved_as):
+    loader = DataLoader(data_dir=str(tmp_path))
+    df = pd.DataFrame({"pillar": ["ACCESS", "USAGE"], "value": [49.0, 35.5]})
+
+    file_path = loader.save_processed_data(df, filename, fmt=fmt)
+
+    assert file_path == loader.processed_dir / saved_as
+    assert sorted(path.name for path in loader.processed_dir.iterdir()) == [saved_as]
+    pd.testing.assert_frame_equal(loader.load_processed_data(saved_as), df, check_dtype=False)
+
+
+@pytest.mark.parametrize("filename,fmt", [("summary.csv", "parquet"), ("summary.parquet", "csv"), ("summary", "xlsx")])
+def test_save_processed_data_rejects_conflicting_format(tmp_path, filename, fmt):
+    loader = DataLoader(data_dir=str(tmp_path))
+
+    with pytest.raises(ValueError):
+        loader.save_processed_data(pd.DataFrame({"value": [1]}), filename, fmt=fmt)
+
+    assert list(loader.processed_dir.iterdir()) == []
+
+
+def test_verbose_loader_does_not_change_other_loaders(loader, caplog):
+    module_logger = logging.getLogger(data_loader.__name__)
+    level_before = module_logger.level
+    verbose_loader = DataLoader(data_dir=str(loader.data_dir), verbose=True)
+    verbose_loader._excel_engine = None
+
+    assert module_logger.level == level_before
+
+    caplog.set_level(logging.INFO, logger=data_loader.__name__)
+    loader.load_unified_data()
+    assert not any("Columns:" in record.getMessage() for record in caplog.records)
+
+    caplog.clear()
+    verbose_loader.load_unified_data()
+    assert any("Columns:" in record.getMessage() for record in caplog.records)